@@ -1,3 +1,4 @@
+import asyncio
 from typing import Callable, Tuple, Union, Optional
 
 import pytest
@@ -17,6 +18,16 @@ def _check_lua_module_supported() -> bool:
         return False
 
 
+@pytest_asyncio.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop for async tests when it is installed, the default asyncio policy otherwise"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest_asyncio.fixture(scope="session")
 def real_redis_version() -> Tuple[str, Union[None, Tuple[int, ...]]]:
     """Returns server's version or None if server is not running"""
@@ -3,7 +3,7 @@ import re
 import sys
 
 if sys.version_info >= (3, 11):
-    from asyncio import timeout as async_timeout
+    async_timeout = asyncio.timeout
 else:
     from async_timeout import timeout as async_timeout
 import pytest
@@ -18,10 +18,19 @@ pytestmark = []
 fake_only = pytest.mark.parametrize("async_redis", [pytest.param("fake", marks=pytest.mark.fake)], indirect=True)
 pytestmark.extend(
     [
-        pytest.mark.asyncio,
+        pytest.mark.asyncio(loop_scope="session"),
     ]
 )
 
+_CONNECTION_POOL_REPR_RE = re.compile(
+    r"<redis.asyncio.connection.ConnectionPool("
+    r"<fakeredis.aioredis.FakeConnection(server=<fakeredis._server.FakeServer object at .*>,db=0)>)>"
+)
+_PUBSUB_MESSAGE1 = {"channel": b"channel", "pattern": None, "type": "message", "data": b"message1"}
+_PUBSUB_MESSAGE2 = {**_PUBSUB_MESSAGE1, "data": b"message2"}
+_HSET_MAPPING = {"key1": "value1", "key2": "value2", "key3": 123}
+_HSET_EXPECTED = {b"key1": b"value1", b"key2": b"value2", b"key3": b"123"}
+
 
 @pytest_asyncio.fixture
 async def conn(async_redis: redis.asyncio.Redis):
@@ -36,9 +45,9 @@ async def test_ping(async_redis: redis.asyncio.Redis):
 
 
 async def test_types(async_redis: redis.asyncio.Redis):
-    await async_redis.hset("hash", mapping={"key1": "value1", "key2": "value2", "key3": 123})
+    await async_redis.hset("hash", mapping=_HSET_MAPPING)
     result = await async_redis.hgetall("hash")
-    assert result == {b"key1": b"value1", b"key2": b"value2", b"key3": b"123"}
+    assert result == _HSET_EXPECTED
 
 
 async def test_transaction(async_redis: redis.asyncio.Redis):
@@ -46,8 +55,7 @@ async def test_transaction(async_redis: redis.asyncio.Redis):
         tr.set("key1", "value1")
         tr.set("key2", "value2")
         ok1, ok2 = await tr.execute()
-    assert ok1
-    assert ok2
+    assert ok1 and ok2
     result = await async_redis.get("key1")
     assert result == b"value1"
 
@@ -63,47 +71,33 @@ async def test_transaction_fail(async_redis: redis.asyncio.Redis):
             await tr.execute()
 
 
-async def test_pubsub(async_redis, event_loop):
-    queue = asyncio.Queue()
-
-    async def reader(ps):
-        while True:
-            message = await ps.get_message(ignore_subscribe_messages=True, timeout=5)
-            if message is not None:
-                if message.get("data") == b"stop":
-                    break
-                queue.put_nowait(message)
-
+async def test_pubsub(async_redis):
     async with async_timeout(5), async_redis.pubsub() as ps:
         await ps.subscribe("channel")
-        task = event_loop.create_task(reader(ps))
         await async_redis.publish("channel", "message1")
         await async_redis.publish("channel", "message2")
-        result1 = await queue.get()
-        result2 = await queue.get()
-        assert result1 == {"channel": b"channel", "pattern": None, "type": "message", "data": b"message1"}
-        assert result2 == {"channel": b"channel", "pattern": None, "type": "message", "data": b"message2"}
-        await async_redis.publish("channel", "stop")
-        await task
+        assert (await ps.get_message(timeout=5))["type"] == "subscribe"
+        result1 = await ps.get_message(ignore_subscribe_messages=True, timeout=5)
+        result2 = await ps.get_message(ignore_subscribe_messages=True, timeout=5)
+        assert result1 == _PUBSUB_MESSAGE1
+        assert result2 == _PUBSUB_MESSAGE2
 
 
-@pytest.mark.slow
 async def test_pubsub_timeout(async_redis: redis.asyncio.Redis):
     async with async_redis.pubsub() as ps:
         await ps.subscribe("channel")
         await ps.get_message(timeout=0.5)  # Subscription message
-        message = await ps.get_message(timeout=0.5)
+        message = await ps.get_message(timeout=0.05)
         assert message is None
 
 
-@pytest.mark.slow
 async def test_pubsub_disconnect(async_redis: redis.asyncio.Redis):
     async with async_redis.pubsub() as ps:
         await ps.subscribe("channel")
         await ps.connection.disconnect()
         message = await ps.get_message(timeout=0.5)  # Subscription message
         assert message is not None
-        message = await ps.get_message(timeout=0.5)
+        message = await ps.get_message(timeout=0.05)
         assert message is None
 
 
@@ -114,22 +108,20 @@ async def test_blocking_ready(async_redis, conn):
     assert result == (b"list", b"x")
 
 
-@pytest.mark.slow
 async def test_blocking_timeout(conn):
     """Blocking command that times out without completing."""
-    result = await conn.blpop("missing", timeout=1)
+    result = await conn.blpop("missing", timeout=0.05)
     assert result is None
 
 
-@pytest.mark.slow
-async def test_blocking_unblock(async_redis, conn, event_loop):
+async def test_blocking_unblock(async_redis, conn):
     """Blocking command that gets unblocked after some time."""
 
     async def unblock():
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0.001)
         await async_redis.rpush("list", "y")
 
-    task = event_loop.create_task(unblock())
+    task = asyncio.create_task(unblock())
     result = await conn.blpop("list", timeout=1)
     assert result == (b"list", b"y")
     await task
@@ -167,11 +159,7 @@ class TestScripts:
 
 @testtools.run_test_if_redispy_ver("gte", "5.1")
 async def test_repr_redis_51(async_redis: redis.asyncio.Redis):
-    assert re.fullmatch(
-        r"<redis.asyncio.connection.ConnectionPool("
-        r"<fakeredis.aioredis.FakeConnection(server=<fakeredis._server.FakeServer object at .*>,db=0)>)>",
-        repr(async_redis.connection_pool),
-    )
+    assert _CONNECTION_POOL_REPR_RE.fullmatch(repr(async_redis.connection_pool))
 
 
 @fake_only
@@ -191,18 +179,19 @@ async def test_disconnect_server(async_redis, fake_server):
 
 
 async def test_type(async_redis: redis.asyncio.Redis):
-    await async_redis.set("string_key", "value")
-    await async_redis.lpush("list_key", "value")
-    await async_redis.sadd("set_key", "value")
-    await async_redis.zadd("zset_key", {"value": 1})
-    await async_redis.hset("hset_key", "key", "value")
+    async with async_redis.pipeline(transaction=False) as pipe:
+        pipe.set("string_key", "value")
+        pipe.lpush("list_key", "value")
+        pipe.sadd("set_key", "value")
+        pipe.zadd("zset_key", {"value": 1})
+        pipe.hset("hset_key", "key", "value")
+        await pipe.execute()
 
-    assert b"string" == await async_redis.type("string_key")  # noqa: E721
-    assert b"list" == await async_redis.type("list_key")  # noqa: E721
-    assert b"set" == await async_redis.type("set_key")  # noqa: E721
-    assert b"zset" == await async_redis.type("zset_key")  # noqa: E721
-    assert b"hash" == await async_redis.type("hset_key")  # noqa: E721
-    assert b"none" == await async_redis.type("none_key")  # noqa: E721
+    async with async_redis.pipeline(transaction=True) as tr:
+        for key in ("string_key", "list_key", "set_key", "zset_key", "hset_key", "none_key"):
+            tr.type(key)
+        types = await tr.execute()
+    assert types == [b"string", b"list", b"set", b"zset", b"hash", b"none"]
 
 
 async def test_xdel(async_redis: redis.asyncio.Redis):
@@ -211,53 +200,55 @@ async def test_xdel(async_redis: redis.asyncio.Redis):
     # deleting from an empty stream doesn't do anything
     assert await async_redis.xdel(stream, 1) == 0
 
-    m1 = await async_redis.xadd(stream, {"foo": "bar"})
-    m2 = await async_redis.xadd(stream, {"foo": "bar"})
-    m3 = await async_redis.xadd(stream, {"foo": "bar"})
+    async with async_redis.pipeline(transaction=False) as pipe:
+        pipe.xadd(stream, {"foo": "bar"})
+        pipe.xadd(stream, {"foo": "bar"})
+        pipe.xadd(stream, {"foo": "bar"})
+        m1, m2, m3 = await pipe.execute()
 
     # xdel returns the number of deleted elements
-    assert await async_redis.xdel(stream, m1) == 1
-    assert await async_redis.xdel(stream, m2, m3) == 2
+    async with async_redis.pipeline(transaction=False) as pipe:
+        pipe.xdel(stream, m1)
+        pipe.xdel(stream, m2, m3)
+        assert await pipe.execute() == [1, 2]
 
 
+@pytest.mark.parametrize("version_kwargs", [{}, {"version": (6,)}], ids=["default", "version6"])
 @pytest.mark.fake
-async def test_from_url():
-    r0 = aioredis.FakeRedis.from_url("redis://localhost?db=0")
-    r1 = aioredis.FakeRedis.from_url("redis://localhost?db=1")
-    # Check that they are indeed different databases
-    await r0.set("foo", "a")
-    await r1.set("foo", "b")
-    assert await r0.get("foo") == b"a"
-    assert await r1.get("foo") == b"b"
-    await r0.connection_pool.disconnect()
-    await r1.connection_pool.disconnect()
-
-
-@pytest.mark.fake
-async def test_from_url_with_version():
-    r0 = aioredis.FakeRedis.from_url("redis://localhost?db=0", version=(6,))
-    r1 = aioredis.FakeRedis.from_url("redis://localhost?db=1", version=(6,))
-    # Check that they are indeed different databases
-    await r0.set("foo", "a")
-    await r1.set("foo", "b")
-    assert await r0.get("foo") == b"a"
-    assert await r1.get("foo") == b"b"
-    await r0.connection_pool.disconnect()
-    await r1.connection_pool.disconnect()
+async def test_from_url(version_kwargs):
+    r0 = aioredis.FakeRedis.from_url("redis://localhost?db=0", **version_kwargs)
+    r1 = aioredis.FakeRedis.from_url("redis://localhost?db=1", **version_kwargs)
+    async with r0, r1:
+        # Check that they are indeed different databases
+        await asyncio.gather(r0.set("foo", "a"), r1.set("foo", "b"))
+        assert await asyncio.gather(r0.get("foo"), r1.get("foo")) == [b"a", b"b"]
 
 
 @fake_only
 async def test_from_url_with_server(async_redis, fake_server):
-    r2 = aioredis.FakeRedis.from_url("redis://localhost", server=fake_server)
-    await async_redis.set("foo", "bar")
-    assert await r2.get("foo") == b"bar"
-    await r2.connection_pool.disconnect()
+    async with aioredis.FakeRedis.from_url("redis://localhost", server=fake_server) as r2:
+        await async_redis.set("foo", "bar")
+        assert await r2.get("foo") == b"bar"
 
 
 @pytest.mark.fake
-async def test_without_server():
-    r = aioredis.FakeRedis()
-    assert await r.ping()
+class TestWithoutServer:
+    @pytest_asyncio.fixture(scope="class")
+    async def client(self):
+        """A single client without an explicit server, shared by the tests in this class."""
+        client = aioredis.FakeRedis()
+        yield client
+        await client.connection_pool.disconnect()
+
+    async def test_without_server(self, client: redis.asyncio.Redis):
+        assert await client.ping()
+
+    async def test_async(self, client: redis.asyncio.Redis):
+        # act
+        await client.set("fakeredis", "plz")
+        x = await client.get("fakeredis")
+        # assert
+        assert x == b"plz"
 
 
 @pytest.mark.fake
@@ -267,17 +258,6 @@ async def test_without_server_disconnected():
         await r.ping()
 
 
-@pytest.mark.fake
-async def test_async():
-    # arrange
-    cache = aioredis.FakeRedis()
-    # act
-    await cache.set("fakeredis", "plz")
-    x = await cache.get("fakeredis")
-    # assert
-    assert x == b"plz"
-
-
 @testtools.run_test_if_redispy_ver("gte", "4.4.0")
 @pytest.mark.parametrize("nowait", [False, True])
 @pytest.mark.fake
@@ -302,9 +282,17 @@ async def test_connection_with_username_and_password():
     assert result.decode() == test_value
 
 
+@pytest.mark.fake
+async def test_sync_async_isolation():
+    sync_r = FakeStrictRedis()
+    async_r = FakeAsyncRedis()
+
+    await async_r.set("foo", "bar")
+    assert sync_r.get("foo") is None
+
+
 @pytest.mark.fake
 async def test_init_args():
-    sync_r1 = FakeStrictRedis()
     r1 = FakeAsyncRedis()
     r5 = FakeAsyncRedis()
     r2 = FakeAsyncRedis(server=FakeServer())
@@ -318,7 +306,6 @@ async def test_init_args():
 
     assert await r1.get("foo") == b"bar"
     assert await r5.get("foo") is None
-    assert sync_r1.get("foo") is None
     assert await r2.get("foo") is None
     assert await r3.get("foo") is None
 
@@ -327,7 +314,6 @@ async def test_init_args():
     assert await r1.get("bar") is None
 
 
-@pytest.mark.asyncio
 async def test_cause_fakeredis_bug(async_redis):
     if sys.version_info < (3, 11):
         return
@@ -342,5 +328,4 @@ async def test_cause_fakeredis_bug(async_redis):
         assert await async_redis.blpop("list1") == (b"list1", b"list1_val")  # 2
         assert await async_redis.rpush("list2", "list2_val") == 1  # 3
 
-    # await async_redis.get("foo")  # uncomment to make test pass
     assert await async_redis.get("foo") == b"bar"
@@ -6,7 +6,7 @@ import redis
 pytestmark = []
 pytestmark.extend(
     [
-        pytest.mark.asyncio,
+        pytest.mark.asyncio(loop_scope="session"),
     ]
 )
 